@@ -1,6 +1,7 @@
 import os
 import json
 import hmac
+import zlib
 import requests
 from fastapi import FastAPI, Header, HTTPException
 from fastapi.responses import StreamingResponse
@@ -30,7 +31,7 @@ HEADERS_BASE = {
 SESSION = requests.Session()
 SESSION.headers.update(HEADERS_BASE)
 
-app = FastAPI(title="Sales Agent API", version="1.4")
+app = FastAPI(title="Sales Agent API", version="1.5")
 
 
 class ChatRequest(BaseModel):
@@ -88,8 +89,40 @@ def normalize(s: str) -> str:
     return " ".join((s or "").split())
 
 
+def accepts_gzip(accept_encoding: str | None) -> bool:
+    # Négociation Accept-Encoding : gzip uniquement s'il est annoncé avec q > 0
+    for part in (accept_encoding or "").split(","):
+        token, _, params = part.partition(";")
+        if token.strip().lower() != "gzip":
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    q = float(value.strip())
+                except ValueError:
+                    q = 0.0
+        return q > 0
+    return False
+
+
+def gzip_frames(frames):
+    # Un seul flux gzip pour toute la réponse (le dictionnaire profite des frames précédentes),
+    # mais Z_SYNC_FLUSH après chaque frame SSE : aucun delta ne reste bloqué dans le buffer
+    # du compresseur, le client peut le décoder dès réception.
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    for frame in frames:
+        yield compressor.compress(frame.encode("utf-8")) + compressor.flush(zlib.Z_SYNC_FLUSH)
+    yield compressor.flush()
+
+
 @app.post("/chat/stream")
-def chat_stream(req: ChatRequest, x_api_key: str | None = Header(default=None)):
+def chat_stream(
+    req: ChatRequest,
+    x_api_key: str | None = Header(default=None),
+    accept_encoding: str | None = Header(default=None),
+):
     if API_KEY:
         if not x_api_key or not hmac.compare_digest(x_api_key, API_KEY):
             raise HTTPException(status_code=401, detail="Unauthorized")
@@ -219,7 +252,19 @@ def chat_stream(req: ChatRequest, x_api_key: str | None = Header(default=None)):
         except Exception as e:
             yield f"event: error\ndata: {json.dumps({'exception': str(e)})}\n\n"
 
-    return StreamingResponse(event_generator(), media_type="text/event-stream")
+    # ✅ Compression opt-in : seulement si le client annonce gzip
+    if accepts_gzip(accept_encoding):
+        return StreamingResponse(
+            gzip_frames(event_generator()),
+            media_type="text/event-stream",
+            headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"},
+        )
+
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={"Vary": "Accept-Encoding"},
+    )
 
 
 @app.get("/health")
@@ -259,7 +259,10 @@ def run_stream(ui_key: str, prompt: str):
     }
     #headers = {"X-API-Key": API_KEY} if API_KEY else {}
     headers = {
-    "x-api-key": st.secrets["API_KEY"]
+    "x-api-key": st.secrets["API_KEY"],
+    # Stream SSE compressé (gzip flushé par frame) ; requests/urllib3 le décode
+    # chunk par chunk, donc iter_lines reçoit chaque delta sans attendre la fin.
+    "Accept-Encoding": "gzip",
 }
 
 